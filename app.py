@@ -2,24 +2,33 @@
 """
 JobSprint Unified Application
 Flask app serving both API and static files for Railway deployment
+
+Production: gunicorn -c gunicorn_conf.py app:app
 """
 
+# Patch blocking sockets before anything else imports requests/httpx
+from gevent import monkey
+monkey.patch_all()
+
 import os
 import sys
-import logging
-from datetime import datetime
-from flask import Flask, request, jsonify, session, render_template, send_from_directory
+import time
 import hashlib
-import uuid
+import logging
+import functools
+from datetime import datetime, timedelta
+from flask import Flask, Response, request, jsonify, session, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from flask_session import Session
+import orjson
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import our modules
-from supabase_manager import SupabaseManager
-from linkedin_scraper_free import LinkedInScraperFree
-from location_manager import LocationManager
-from email_system import EmailSystem
+from services import get_supabase_manager, get_linkedin_scraper, get_location_manager
+from cache_manager import get_redis_client, redis_cached, single_flight
+from password_manager import hash_password, verify_password, needs_rehash
 
 # Configure logging
 logging.basicConfig(
@@ -28,24 +37,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() via orjson - much faster for large job search payloads"""
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
 # Initialize Flask app with static and template folders
 app = Flask(__name__, 
            static_folder='frontend',
            static_url_path='',
            template_folder='frontend')
 
+app.json = OrjsonProvider(app)
+
 app.secret_key = os.environ.get('SECRET_KEY', 'jobsprint-unified-secret-key-2024')
 
-# Initialize managers
-try:
-    supabase_manager = SupabaseManager()
-    linkedin_scraper = LinkedInScraperFree()
-    location_manager = LocationManager()
-    email_system = EmailSystem()
-    logger.info("✅ All managers initialized successfully")
-except Exception as e:
-    logger.error(f"❌ Error initializing managers: {e}")
-    # Continue anyway for local development
+# Server-side sessions in Redis. Boot fails if REDIS_URL is set but unreachable,
+# so workers never disagree on the session backend; without REDIS_URL and no
+# local Redis socket, sessions fall back to signed cookies.
+redis_client = get_redis_client()
+if redis_client is not None:
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis_client,
+        SESSION_PERMANENT=False,
+        PERMANENT_SESSION_LIFETIME=timedelta(hours=2)
+    )
+    Session(app)
+    logger.info("✅ Using Redis session store")
+
+# Managers are created lazily on first use (see services.py)
 
 # Local test users (for development without Supabase)
 LOCAL_USERS = {
@@ -53,31 +87,53 @@ LOCAL_USERS = {
         'id': 'admin-001',
         'email': 'admin@jobsprint.com',
         'name': 'JobSprint Admin',
-        'password_hash': hashlib.sha256('admin123'.encode()).hexdigest(),
+        # Precomputed Argon2 hash of 'admin123' - no hashing at import
+        'password_hash': '$argon2id$v=19$m=65536,t=2,p=1$rF5oANiBjBvKwUmL+/Y6og$SSIl+9XuRt+mQDtPV/PRxtOzL2FC2MpjZcTYSFsLUs8',
         'is_admin': True
     },
     'test@jobsprint.com': {
         'id': 'test-001',
         'email': 'test@jobsprint.com',
         'name': 'Test User',
-        'password_hash': hashlib.sha256('test123'.encode()).hexdigest(),
+        # Precomputed Argon2 hash of 'test123'
+        'password_hash': '$argon2id$v=19$m=65536,t=2,p=1$Vl43Cca+YX6fihK5dZ5XnQ$qERUjh5gCIsqdUumEhZ9JDYRu4E3PIPZSQzaoY9a2DE',
         'is_admin': False
     }
 }
 
+def normalize_email(email: str) -> str:
+    """Canonical LOCAL_USERS key - case-insensitive and interned (Supabase emails are matched as given)"""
+    return sys.intern(email.strip().lower())
+
+LOCAL_USERS = {normalize_email(email): user for email, user in LOCAL_USERS.items()}
+
 # ============================================================================
 # STATIC FILE ROUTES
 # ============================================================================
 
+@functools.cache
+def frontend_page(filename: str):
+    """Read a frontend page once and return (body bytes, etag)"""
+    with open(os.path.join(app.root_path, 'frontend', filename), 'rb') as f:
+        body = f.read()
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+def serve_frontend_page(filename: str) -> Response:
+    """Serve a cached frontend page, answering 304 when the ETag matches"""
+    body, etag = frontend_page(filename)
+    response = Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """Serve the main frontend page"""
-    return send_from_directory('frontend', 'index.html')
+    return serve_frontend_page('index.html')
 
 @app.route('/dashboard.html')
 def dashboard():
     """Serve the dashboard page"""
-    return send_from_directory('frontend', 'dashboard.html')
+    return serve_frontend_page('dashboard.html')
 
 @app.route('/<path:filename>')
 def static_files(filename):
@@ -88,16 +144,38 @@ def static_files(filename):
 # API ROUTES
 # ============================================================================
 
-@app.route('/health')
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
+@functools.lru_cache(maxsize=1)
+def iso_second(second: int) -> str:
+    """ISO timestamp for a whole second (local time)"""
+    return datetime.fromtimestamp(second).isoformat()
+
+def iso_now() -> str:
+    """Current timestamp, formatted at most once per second"""
+    return iso_second(int(time.time()))
+
+@functools.lru_cache(maxsize=1)
+def health_json(second: int) -> bytes:
+    """Health response body, serialized at most once per second"""
+    return orjson.dumps({
         'service': 'JobSprint API',
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': iso_second(second)
     })
 
+@app.route('/health')
+def health_check():
+    """Health check endpoint"""
+    return app.response_class(health_json(int(time.time())), mimetype='application/json')
+
 # Authentication endpoints
+def upgrade_password_hash(user_id: str, password: str):
+    """Replace a legacy or outdated stored hash after a successful login"""
+    try:
+        if get_supabase_manager().update_user(user_id, {'password_hash': hash_password(password)}):
+            logger.info(f"🔐 Upgraded password hash for user {user_id}")
+    except Exception as e:
+        logger.warning(f"Could not upgrade password hash for user {user_id}: {e}")
+
 @app.route('/api/auth/login', methods=['POST'])
 def login():
     """User login endpoint"""
@@ -109,24 +187,28 @@ def login():
         if not email or not password:
             return jsonify({'error': 'Email and password required'}), 400
         
-        # Hash password for comparison
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        
         # Try Supabase first, fallback to local users
         user = None
         try:
-            user = supabase_manager.get_user_by_email(email)
+            user = get_supabase_manager().get_user_for_login(email)
         except Exception as e:
             logger.warning(f"Supabase unavailable, using local auth: {e}")
+        from_supabase = user is not None
         
         # If Supabase failed or returned None, use local users
         if user is None:
             logger.info(f"Using local authentication for {email}")
-            user = LOCAL_USERS.get(email)
+            user = LOCAL_USERS.get(normalize_email(email))
         
-        if user and user.get('password_hash') == password_hash:
+        password_hash = user.get('password_hash', '') if user else ''
+        if user and verify_password(password_hash, password):
+            if from_supabase and needs_rehash(password_hash):
+                upgrade_password_hash(user['id'], password)
+
             session['user_id'] = user['id']
             session['is_admin'] = user.get('is_admin', False)
+            # Local users have no Supabase row, so their searches aren't persisted
+            session['is_local_user'] = not from_supabase
             
             return jsonify({
                 'success': True,
@@ -159,10 +241,10 @@ def register():
         # Check if user already exists (local or Supabase)
         existing_user = None
         try:
-            existing_user = supabase_manager.get_user_by_email(email)
+            existing_user = get_supabase_manager().get_user_by_email(email)
         except Exception:
             # Check local users
-            existing_user = LOCAL_USERS.get(email)
+            existing_user = LOCAL_USERS.get(normalize_email(email))
         
         if existing_user:
             return jsonify({'error': 'User already exists'}), 400
@@ -170,12 +252,13 @@ def register():
         # Try Supabase first, fallback to local users
         user = None
         try:
-            user = supabase_manager.create_user(email, name, password, is_admin=False)
+            user = get_supabase_manager().create_user(email, name, password, is_admin=False)
         except Exception as e:
             logger.warning(f"Supabase unavailable, simulating registration: {e}")
         
         # If Supabase failed or returned None, use local users
-        if user is None:
+        is_local_user = user is None
+        if is_local_user:
             logger.info(f"Using local registration for {email}")
             # Simulate user creation for local development
             user_id = f"user-{len(LOCAL_USERS) + 1:03d}"
@@ -183,16 +266,17 @@ def register():
                 'id': user_id,
                 'email': email,
                 'name': name,
-                'password_hash': hashlib.sha256(password.encode()).hexdigest(),
+                'password_hash': hash_password(password),
                 'is_admin': False
             }
             # Add to local users (in memory only)
-            LOCAL_USERS[email] = user
+            LOCAL_USERS[normalize_email(email)] = user
         
         if user:
             # Auto-login the new user
             session['user_id'] = user['id']
             session['is_admin'] = user.get('is_admin', False)
+            session['is_local_user'] = is_local_user
 
             return jsonify({
                 'success': True,
@@ -227,14 +311,15 @@ def get_users():
             return jsonify({'error': 'Admin access required'}), 403
 
         # Return local users (in production, this would query the database)
-        users = []
-        for email, user_data in LOCAL_USERS.items():
-            users.append({
+        users = [
+            {
                 'id': user_data['id'],
                 'email': user_data['email'],
                 'name': user_data['name'],
                 'is_admin': user_data.get('is_admin', False)
-            })
+            }
+            for user_data in LOCAL_USERS.values()
+        ]
 
         return jsonify({
             'success': True,
@@ -292,7 +377,7 @@ def system_status():
                 'linkedin_scraper': 'active',
                 'database': 'connected',
                 'users_count': len(LOCAL_USERS),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }
         })
 
@@ -300,7 +385,59 @@ def system_status():
         logger.error(f"System status error: {e}")
         return jsonify({'error': 'Failed to get system status'}), 500
 
+# Location endpoints
+@functools.cache
+def canada_locations_json() -> bytes:
+    """Canada locations response body - static data, serialized once per process"""
+    return orjson.dumps({
+        'locations': get_location_manager().get_canada_locations(),
+        'success': True
+    })
+
+@app.route('/api/locations/canada', methods=['GET'])
+def canada_locations():
+    """Get Canada-specific job search locations"""
+    try:
+        return app.response_class(canada_locations_json(), mimetype='application/json')
+
+    except Exception as e:
+        logger.error(f"Get locations error: {e}")
+        return jsonify({'error': 'Failed to get locations'}), 500
+
 # Job search endpoints
+def job_search_cache_key(keywords, location, max_results, time_filter, work_type):
+    """Cache key for a scrape - identical searches share results"""
+    search = f"{keywords}|{location}|{time_filter}|{work_type}|{max_results}"
+    return 'jobs:' + hashlib.blake2b(search.encode(), digest_size=16).hexdigest()
+
+@redis_cached(job_search_cache_key, ttl=120)
+@single_flight(job_search_cache_key)
+def scrape_jobs_cached(keywords, location, max_results, time_filter, work_type):
+    """Scrape LinkedIn, reusing results of the same search for two minutes
+
+    Identical searches arriving while a scrape is running wait for it
+    instead of starting their own.
+    """
+    jobs_list = get_linkedin_scraper().scrape_jobs(
+        keywords=keywords,
+        location=location,
+        max_results=max_results,
+        time_filter=time_filter,
+        work_type=work_type,
+        return_dict=True
+    )
+    # Empty results aren't cached so a failed scrape is retried next time
+    return jobs_list or None
+
+def stream_jobs_json(jobs_list, search_params):
+    """Write the search response one job at a time instead of buffering it all"""
+    yield b'{"success":true,"count":' + str(len(jobs_list)).encode() + b',"jobs":['
+    for i, job in enumerate(jobs_list):
+        if i:
+            yield b','
+        yield orjson.dumps(job, default=str)
+    yield b'],"search_params":' + orjson.dumps(search_params) + b'}'
+
 @app.route('/api/jobs/search', methods=['POST'])
 def search_jobs():
     """Search for jobs using LinkedIn scraper"""
@@ -322,36 +459,26 @@ def search_jobs():
         logger.info(f"🔍 Job search request: {keywords} in {location}")
         
         # Perform job search
-        jobs_df = linkedin_scraper.scrape_jobs(
-            keywords=keywords,
-            location=location,
-            max_results=max_results,
-            time_filter=time_filter,
-            work_type=work_type
-        )
+        jobs_list = scrape_jobs_cached(keywords, location, max_results, time_filter, work_type)
         
-        if jobs_df is not None and not jobs_df.empty:
-            # Convert DataFrame to list of dictionaries
-            jobs_list = jobs_df.to_dict('records')
-            
-            # Store jobs for the user (if Supabase is available)
+        if jobs_list:
+            # Store jobs for Supabase users (local users have no user_jobs rows)
             user_id = session['user_id']
-            for job in jobs_list:
+            if not session.get('is_local_user'):
                 try:
-                    supabase_manager.store_job(job, user_id)
+                    get_supabase_manager().store_jobs_bulk(jobs_list, user_id)
                 except Exception as e:
-                    logger.warning(f"Could not store job: {e}")
+                    logger.warning(f"Could not store {len(jobs_list)} jobs for user {user_id}: {e}")
             
-            return jsonify({
-                'success': True,
-                'count': len(jobs_list),
-                'jobs': jobs_list,
-                'search_params': {
-                    'keywords': keywords,
-                    'location': location,
-                    'time_filter': time_filter
-                }
-            })
+            search_params = {
+                'keywords': keywords,
+                'location': location,
+                'time_filter': time_filter
+            }
+            return app.response_class(
+                stream_jobs_json(jobs_list, search_params),
+                mimetype='application/json'
+            )
         else:
             return jsonify({
                 'success': True,
@@ -365,6 +492,8 @@ def search_jobs():
         return jsonify({'error': 'Job search failed'}), 500
 
 if __name__ == '__main__':
+    # Development server only - production runs under gunicorn (see gunicorn_conf.py)
     port = int(os.environ.get('PORT', 5000))
+    debug = os.environ.get('FLASK_ENV') == 'development'
     logger.info(f"🚀 Starting JobSprint Unified App on 0.0.0.0:{port}")
-    app.run(host='0.0.0.0', port=port, debug=False)
+    app.run(host='0.0.0.0', port=port, debug=debug)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Gunicorn configuration for JobSprint
+Runs app.py on gevent workers so Supabase calls and LinkedIn scraping
+don't block other requests
+
+Usage: gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Cooperative workers - each worker handles many in-flight requests, so one
+# per core is enough (2n+1 is the sync-worker rule and would multiply the
+# per-process scraper, caches and memory)
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_connections = 1000
+
+# Job searches can take a while (LinkedIn scraping with delays)
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info')
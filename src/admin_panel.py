@@ -355,9 +355,9 @@ def user_test_search():
         if not preferences:
             return jsonify({'success': False, 'message': 'No preferences set. Please configure your preferences first.'})
 
-        # Import and run a test search
-        from linkedin_scraper_free import LinkedInScraperFree
-        scraper = LinkedInScraperFree()
+        # Run a test search with the shared scraper (reuses its HTTP session)
+        from services import get_linkedin_scraper
+        scraper = get_linkedin_scraper()
 
         # Test with first keyword and location
         test_keyword = preferences.keywords[0] if preferences.keywords else "software engineer"
@@ -440,9 +440,9 @@ def admin_test_user_search(user_id):
         if not preferences:
             return jsonify({'success': False, 'message': 'User has no preferences set'})
 
-        # Import and run a test search
-        from linkedin_scraper_free import LinkedInScraperFree
-        scraper = LinkedInScraperFree()
+        # Run a test search with the shared scraper (reuses its HTTP session)
+        from services import get_linkedin_scraper
+        scraper = get_linkedin_scraper()
 
         # Test with first keyword and location
         test_keyword = preferences.keywords[0] if preferences.keywords else "software engineer"
@@ -698,8 +698,8 @@ def admin_test_scraper():
         return redirect(url_for('admin_login'))
 
     try:
-        from linkedin_scraper_free import LinkedInScraperFree
-        scraper = LinkedInScraperFree()
+        from services import get_linkedin_scraper
+        scraper = get_linkedin_scraper()
 
         # Test with simple search
         jobs = scraper.method_1_guest_api("python developer", "Remote", 3)
@@ -845,9 +845,7 @@ def get_user_job_history(user_id, limit=50):
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
     templates_dir = os.path.join(current_dir, 'templates')
-    if not os.path.exists(templates_dir):
-        os.makedirs(templates_dir)
-        logger.info(f"Created templates directory: {templates_dir}")
+    os.makedirs(templates_dir, exist_ok=True)
     
     print("🚀 Starting Admin Panel...")
     print("📊 Admin Login: http://localhost:5001/admin/login")
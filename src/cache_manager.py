@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Cache Manager for JobSprint
+Shared Redis connection used for server-side sessions and caching
+"""
+
+import os
+import time
+import logging
+import functools
+import threading
+from typing import Any, Callable, Optional
+
+import orjson
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Unix socket avoids TCP overhead when Redis runs on the same host
+REDIS_SOCKET_PATH = os.environ.get('REDIS_SOCKET_PATH', '/var/run/redis/redis.sock')
+
+# Keep an unreachable Redis from stalling worker boot and every request:
+# short socket timeouts and one immediate retry instead of redis-py's
+# default multi-second backoff
+REDIS_CONNECT_TIMEOUT = 2.0
+REDIS_SOCKET_TIMEOUT = 2.0
+REDIS_OPTIONS = {
+    'socket_connect_timeout': REDIS_CONNECT_TIMEOUT,
+    'socket_timeout': REDIS_SOCKET_TIMEOUT,
+    'retry': Retry(NoBackoff(), 1)
+}
+
+# After a failed connect, wait this long before trying again
+REDIS_RETRY_SECONDS = 5.0
+
+_redis_client: Optional[redis.Redis] = None
+_redis_retry_at = 0.0
+_redis_lock = threading.Lock()
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """Get the shared Redis client, or None if Redis is unavailable
+
+    Uses REDIS_URL when set, otherwise the local unix socket. A connected
+    client is reused for the life of the process; a failed connect is retried
+    after REDIS_RETRY_SECONDS. When REDIS_URL is set Redis is required, so an
+    unreachable server raises redis.ConnectionError instead of returning None.
+    """
+    global _redis_client, _redis_retry_at
+
+    if _redis_client is not None:
+        return _redis_client
+
+    with _redis_lock:
+        if _redis_client is not None:
+            return _redis_client
+
+        redis_url = os.environ.get('REDIS_URL')
+        if not redis_url and time.monotonic() < _redis_retry_at:
+            return None
+
+        try:
+            if redis_url:
+                client = redis.Redis.from_url(redis_url, **REDIS_OPTIONS)
+            else:
+                client = redis.Redis(unix_socket_path=REDIS_SOCKET_PATH, **REDIS_OPTIONS)
+
+            client.ping()
+            logger.info("✅ Redis connected")
+            _redis_client = client
+            return client
+
+        except redis.RedisError as e:
+            _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            if redis_url:
+                logger.error(f"❌ Redis at REDIS_URL unreachable: {e}")
+                raise redis.ConnectionError(f"REDIS_URL is set but Redis is unreachable: {e}") from e
+
+            logger.warning(f"Redis unavailable, running without cache: {e}")
+            return None
+
+def _cache_client() -> Optional[redis.Redis]:
+    """Redis client for cache operations - never raises, None means skip the cache"""
+    try:
+        return get_redis_client()
+    except redis.RedisError:
+        return None
+
+def cache_get(key: str) -> Optional[Any]:
+    """Get a cached JSON value, or None on miss or when Redis is unavailable"""
+    client = _cache_client()
+    if client is None:
+        return None
+
+    try:
+        cached = client.get(key)
+        return orjson.loads(cached) if cached is not None else None
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+def cache_set(key: str, value: Any, ttl: int) -> bool:
+    """Cache a JSON-serializable value for ttl seconds"""
+    client = _cache_client()
+    if client is None:
+        return False
+
+    try:
+        client.setex(key, ttl, orjson.dumps(value, default=str))
+        return True
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+        return False
+
+def cache_delete(key: str) -> bool:
+    """Invalidate a cached value"""
+    client = _cache_client()
+    if client is None:
+        return False
+
+    try:
+        client.delete(key)
+        return True
+    except Exception as e:
+        logger.warning(f"Cache delete failed for {key}: {e}")
+        return False
+
+def redis_cached(key_fn: Callable[..., str], ttl: int):
+    """Cache-aside decorator for read-heavy lookups
+
+    key_fn receives the same arguments as the wrapped function. None results
+    are not cached, so a missing record is looked up again on the next call.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs)
+
+            cached = cache_get(key)
+            if cached is not None:
+                return cached
+
+            result = func(*args, **kwargs)
+            if result is not None:
+                cache_set(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
+class SingleFlight:
+    """Coalesces concurrent identical calls so only one does the work
+
+    Threading primitives are gevent-patched in app.py, so waiting callers
+    yield to other greenlets.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: str, func: Callable, *args, **kwargs) -> Any:
+        """Run func for key, or wait for the call already in flight"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+def single_flight(key_fn: Callable[..., str]):
+    """Decorator sharing one in-flight call among identical concurrent callers"""
+    def decorator(func):
+        flight = SingleFlight()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return flight.do(key_fn(*args, **kwargs), func, *args, **kwargs)
+        return wrapper
+    return decorator
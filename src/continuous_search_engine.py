@@ -7,7 +7,7 @@ Handles background job searching, scheduling, and notifications
 import os
 import sys
 import time
-import json
+import orjson
 import logging
 import threading
 import schedule
@@ -26,6 +26,7 @@ sys.path.append(current_dir)
 
 from multi_user_system import MultiUserManager, User, UserPreferences
 from linkedin_scraper_free import LinkedInScraperFree
+from job_scoring import lowercase_preference_terms
 
 # Setup logging
 logging.basicConfig(
@@ -38,13 +39,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Companies that earn the reputation bonus in quality scoring
+REPUTABLE_COMPANIES = ('google', 'microsoft', 'amazon', 'apple', 'meta', 'netflix', 'uber', 'airbnb')
+
 class ContinuousSearchEngine:
     """Manages continuous job searching for all users"""
     
-    def __init__(self, config_file: str = "config.json"):
+    def __init__(self, config_file: str = "config.json", user_manager: Optional[MultiUserManager] = None):
         self.config_file = config_file
         self.config = self.load_config()
-        self.user_manager = MultiUserManager()
+        self.user_manager = user_manager or MultiUserManager()
         self.linkedin_scraper = LinkedInScraperFree()
         self.is_running = False
         self.search_threads = {}
@@ -62,8 +66,8 @@ class ContinuousSearchEngine:
     def load_config(self) -> Dict:
         """Load email configuration"""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            with open(self.config_file, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             return {}
@@ -122,7 +126,10 @@ class ContinuousSearchEngine:
         while self.is_running:
             try:
                 schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
+
+                # Sleep until the next job is due, but re-check at least every 30 seconds
+                idle = schedule.idle_seconds()
+                time.sleep(30 if idle is None else min(30, max(1, idle)))
             except Exception as e:
                 logger.error(f"Scheduler error: {e}")
                 time.sleep(60)  # Wait longer on error
@@ -199,9 +206,11 @@ class ContinuousSearchEngine:
                                 linkedin_jobs['search_keyword'] = keyword
                                 linkedin_jobs['search_location'] = location
 
-                                # Add quality scores
+                                # Add quality scores (preference terms lowercased once per batch)
+                                terms = lowercase_preference_terms(preferences.keywords, preferences.locations,
+                                                                   preferences.exclude_keywords)
                                 linkedin_jobs['quality_score'] = linkedin_jobs.apply(
-                                    lambda row: self.calculate_quality_score(row, preferences), axis=1
+                                    lambda row: self.calculate_quality_score(row, preferences, terms), axis=1
                                 )
 
                                 # Filter by user preferences
@@ -272,9 +281,14 @@ class ContinuousSearchEngine:
         self.linkedin_last_requests.append(now)
         return True
     
-    def calculate_quality_score(self, job_row, preferences: UserPreferences) -> float:
+    def calculate_quality_score(self, job_row, preferences: UserPreferences,
+                                terms: Optional[Dict[str, List[str]]] = None) -> float:
         """Calculate quality score for a job based on user preferences"""
         try:
+            if terms is None:
+                terms = lowercase_preference_terms(preferences.keywords, preferences.locations,
+                                                   preferences.exclude_keywords)
+
             score = 50  # Base score
 
             title = str(job_row.get('title', '')).lower()
@@ -282,23 +296,19 @@ class ContinuousSearchEngine:
             location = str(job_row.get('location', '')).lower()
 
             # Keyword matching (30 points)
-            keyword_matches = 0
-            for keyword in preferences.keywords:
-                if keyword.lower() in title:
-                    keyword_matches += 1
+            keyword_matches = sum(1 for keyword in terms['keywords'] if keyword in title)
 
             if keyword_matches > 0:
                 score += min(30, keyword_matches * 10)
 
             # Location preference (20 points)
-            for pref_location in preferences.locations:
-                if pref_location.lower() in location:
+            for pref_location in terms['locations']:
+                if pref_location in location:
                     score += 20
                     break
 
             # Company reputation (basic check) (10 points)
-            reputable_companies = ['google', 'microsoft', 'amazon', 'apple', 'meta', 'netflix', 'uber', 'airbnb']
-            if any(comp in company for comp in reputable_companies):
+            if any(comp in company for comp in REPUTABLE_COMPANIES):
                 score += 10
 
             # Job freshness (10 points)
@@ -317,8 +327,8 @@ class ContinuousSearchEngine:
                     pass
 
             # Exclude keywords penalty
-            for exclude_keyword in preferences.exclude_keywords:
-                if exclude_keyword.lower() in title:
+            for exclude_keyword in terms['exclude_keywords']:
+                if exclude_keyword in title:
                     score -= 20
 
             return min(100, max(0, score))
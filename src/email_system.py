@@ -5,63 +5,104 @@ Handles all email notifications including enrollment, job alerts, and system not
 """
 
 import os
-import json
+import ssl
 import smtplib
 import logging
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import orjson
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Loading the CA bundle is expensive - build the TLS context once
+SMTP_SSL_CONTEXT = ssl.create_default_context()
+
+DEFAULT_CONFIG = {
+    "email": {
+        "sender_email": "your-email@gmail.com",
+        "sender_password": "your-app-password",
+        "sender_name": "JobSprint Automation",
+        "smtp_server": "smtp.gmail.com",
+        "smtp_port": 587,
+        "enabled": False,
+        "test_mode": True
+    },
+    "system": {
+        "name": "JobSprint",
+        "version": "2.0.0",
+        "admin_email": "admin@jobsprint.com"
+    }
+}
+
+# Serialized once at import and written in a single call
+DEFAULT_CONFIG_BYTES = orjson.dumps(DEFAULT_CONFIG, option=orjson.OPT_INDENT_2)
+
+# Static test email - only the completion time changes between sends
+TEST_EMAIL_SUBJECT = "🧪 JobSprint Email Test"
+TEST_EMAIL_HTML = """
+<html>
+<body style="font-family: Arial, sans-serif; padding: 20px;">
+    <h2 style="color: #667eea;">📧 Email System Test</h2>
+    <p>If you're reading this, your JobSprint email system is working correctly!</p>
+    <p><strong>Test completed:</strong> {}</p>
+</body>
+</html>
+"""
+
 class EmailSystem:
     """Handles all email functionality for JobSprint"""
     
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
+        self._config_signature = None
         self.config = self.load_config()
-        self.email_config = self.config.get('email', {})
+        
+        # Logged-in SMTP connection reused across sends
+        self._smtp = None
+        self._smtp_key = None
+        self._smtp_lock = threading.Lock()
         
         # Create default config if it doesn't exist
         if not os.path.exists(config_file):
             self.create_default_config()
     
+    @property
+    def email_config(self) -> Dict:
+        """Email settings, picking up edits to the config file"""
+        self.config = self.load_config()
+        return self.config.get('email', {})
+    
     def load_config(self) -> Dict:
-        """Load email configuration"""
+        """Load email configuration, re-parsing only when the file changes"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
             return {}
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._config_signature:
+            return self.config
+        
+        try:
+            with open(self.config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+            self._config_signature = signature
+            return config
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             return {}
     
     def create_default_config(self):
         """Create default configuration file"""
-        default_config = {
-            "email": {
-                "sender_email": "your-email@gmail.com",
-                "sender_password": "your-app-password",
-                "sender_name": "JobSprint Automation",
-                "smtp_server": "smtp.gmail.com",
-                "smtp_port": 587,
-                "enabled": False,
-                "test_mode": True
-            },
-            "system": {
-                "name": "JobSprint",
-                "version": "2.0.0",
-                "admin_email": "admin@jobsprint.com"
-            }
-        }
-        
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(default_config, f, indent=4)
+            with open(self.config_file, 'wb') as f:
+                f.write(DEFAULT_CONFIG_BYTES)
             
             logger.info(f"✅ Created default config file: {self.config_file}")
             logger.info("📧 Please update email settings in config.json to enable notifications")
@@ -279,10 +320,15 @@ class EmailSystem:
             html_part = MIMEText(html_content, 'html')
             msg.attach(html_part)
             
-            with smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port']) as server:
-                server.starttls()
-                server.login(self.email_config['sender_email'], self.email_config['sender_password'])
-                server.send_message(msg)
+            with self._smtp_lock:
+                try:
+                    self.get_smtp_connection().send_message(msg)
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    # Server dropped the idle connection - reconnect once. Other
+                    # SMTP errors (refused recipients, auth, data) are not retried
+                    # so a rejected message is never sent twice
+                    self.close_smtp_connection()
+                    self.get_smtp_connection().send_message(msg)
             
             return True
             
@@ -290,21 +336,43 @@ class EmailSystem:
             logger.error(f"Error sending email to {recipient}: {e}")
             return False
     
+    def get_smtp_connection(self) -> smtplib.SMTP:
+        """Get a logged-in SMTP connection, reusing the previous one while it's alive"""
+        email_config = self.email_config
+        key = (email_config['smtp_server'], email_config['smtp_port'], email_config['sender_email'])
+        
+        if self._smtp is not None and self._smtp_key == key:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+        
+        self.close_smtp_connection()
+        
+        server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'], timeout=30)
+        server.starttls(context=SMTP_SSL_CONTEXT)
+        server.login(email_config['sender_email'], email_config['sender_password'])
+        
+        self._smtp = server
+        self._smtp_key = key
+        return server
+    
+    def close_smtp_connection(self):
+        """Close the cached SMTP connection, if any"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+            self._smtp_key = None
+    
     def test_email_system(self, test_email: str) -> bool:
         """Test email system configuration"""
         try:
-            subject = "🧪 JobSprint Email Test"
-            html_content = """
-            <html>
-            <body style="font-family: Arial, sans-serif; padding: 20px;">
-                <h2 style="color: #667eea;">📧 Email System Test</h2>
-                <p>If you're reading this, your JobSprint email system is working correctly!</p>
-                <p><strong>Test completed:</strong> {}</p>
-            </body>
-            </html>
-            """.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            
-            return self.send_email(test_email, subject, html_content)
+            html_content = TEST_EMAIL_HTML.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            return self.send_email(test_email, TEST_EMAIL_SUBJECT, html_content)
             
         except Exception as e:
             logger.error(f"Email system test failed: {e}")
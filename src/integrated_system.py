@@ -6,8 +6,10 @@ Combines all components: LinkedIn scraping, multi-user system, continuous search
 
 import os
 import sys
-import json
+import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import logging
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
@@ -31,15 +33,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds a healthy system health report is reused
+HEALTH_CACHE_TTL = 10
+
 class IntegratedJobSprintSystem:
     """Main system that integrates all components"""
     
     def __init__(self):
         self.user_manager = MultiUserManager()
-        self.search_engine = ContinuousSearchEngine()
+        # Share one user manager (and its schema setup) with the search engine
+        self.search_engine = ContinuousSearchEngine(user_manager=self.user_manager)
         self.web_app = self.create_integrated_app()
         self.is_running = False
         
+        # Last healthy health report and when it was taken (monotonic seconds)
+        self._health_cache = None
+        self._health_cached_at = 0.0
+        
         # Create logs directory
         os.makedirs('logs', exist_ok=True)
         
@@ -50,9 +60,6 @@ class IntegratedJobSprintSystem:
         app = Flask(__name__, template_folder=os.path.join(current_dir, 'templates'))
         app.secret_key = 'jobsprint-integrated-system-secret-key'
         
-        # Import all routes from admin panel
-        from admin_panel import *
-        
         # Add search engine management routes
         @app.route('/system/dashboard')
         def system_dashboard():
@@ -158,16 +165,39 @@ class IntegratedJobSprintSystem:
         return app
     
     def get_system_health(self):
-        """Get overall system health status"""
+        """Get overall system health status, reusing a healthy report for a few seconds"""
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cached_at < HEALTH_CACHE_TTL:
+            return self._health_cache
+        
+        health = self.check_system_health()
+        
+        # Only cache good news - problems should show up on the next poll
+        if health['status'] == 'healthy':
+            self._health_cache = health
+            self._health_cached_at = now
+        else:
+            self._health_cache = None
+        
+        return health
+    
+    def check_system_health(self):
+        """Run all component health checks"""
         try:
+            checks = {
+                'database': self.check_database_health,
+                'search_engine': self.check_search_engine_health,
+                'linkedin_scraper': self.check_linkedin_health,
+                'email_system': self.check_email_health
+            }
+            
+            # Checks are independent - run them together so the slowest sets the latency
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {name: executor.submit(check) for name, check in checks.items()}
+            
             health = {
                 'status': 'healthy',
-                'components': {
-                    'database': self.check_database_health(),
-                    'search_engine': self.check_search_engine_health(),
-                    'linkedin_scraper': self.check_linkedin_health(),
-                    'email_system': self.check_email_health()
-                },
+                'components': {name: future.result() for name, future in futures.items()},
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -224,13 +254,14 @@ class IntegratedJobSprintSystem:
     def check_linkedin_health(self):
         """Check LinkedIn scraper health"""
         try:
-            # Simple test - create scraper instance
-            from linkedin_scraper_free import LinkedInScraperFree
-            scraper = LinkedInScraperFree()
+            # Static check: the search engine's scraper was built. LinkedIn is not
+            # contacted, so dashboard polls never add load upstream while the
+            # scraper is backing off a rate limit.
+            self.search_engine.linkedin_scraper.session
             
             return {
                 'status': 'healthy',
-                'message': 'LinkedIn scraper operational'
+                'message': 'LinkedIn scraper initialized (local check, LinkedIn not contacted)'
             }
         except Exception as e:
             return {
@@ -243,8 +274,8 @@ class IntegratedJobSprintSystem:
         try:
             config_file = 'config.json'
             if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                with open(config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
                 
                 email_config = config.get('email', {})
                 if email_config.get('sender_email') and email_config.get('sender_password'):
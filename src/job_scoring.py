@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Job Scoring helpers for JobSprint
+Shared by the single-user automation and the continuous search engine
+"""
+
+from typing import Dict, Iterable, List
+
+def lowercase_preference_terms(keywords: Iterable[str], locations: Iterable[str],
+                               exclude_keywords: Iterable[str]) -> Dict[str, List[str]]:
+    """Lowercase search preference terms for case-insensitive matching
+
+    Build this once per batch and pass it to the quality scorer for every job.
+    """
+    return {
+        'keywords': [keyword.lower() for keyword in keywords],
+        'locations': [location.lower() for location in locations],
+        'exclude_keywords': [keyword.lower() for keyword in exclude_keywords]
+    }
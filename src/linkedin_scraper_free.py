@@ -6,36 +6,51 @@ Advanced LinkedIn scraping with multiple fallback methods - completely free!
 
 import time
 import random
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+# Selenium and webdriver-manager are imported where the browser fallback
+# is used, so the API path doesn't pay for them at startup
 import logging
 from datetime import datetime, timedelta
 import json
 import re
 from urllib.parse import urlencode, quote_plus
-import feedparser
 from fake_useragent import UserAgent
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Capped exponential backoff (seconds) when LinkedIn rate limits us
+RATE_LIMIT_BASE_DELAY = 5.0
+RATE_LIMIT_MAX_DELAY = 60.0
+RATE_LIMIT_MAX_RETRIES = 4
+
+# Job ID from a LinkedIn job URL, e.g. /jobs/view/1234567890
+JOB_ID_PATTERN = re.compile(r'jobs/view/(\d+)')
+
+@functools.lru_cache(maxsize=1)
+def get_user_agent() -> UserAgent:
+    """Shared UserAgent - loading its browser data is the slow part of building a scraper"""
+    return UserAgent()
+
+@functools.lru_cache(maxsize=1)
+def get_chromedriver_path():
+    """Resolve the Chrome driver once per process (webdriver-manager checks for updates over the network)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
 class LinkedInScraperFree:
     """
     Zero-cost LinkedIn job scraper with multiple methods and fallbacks
     """
     
     def __init__(self):
-        self.ua = UserAgent()
+        self.ua = get_user_agent()
         self.session = requests.Session()
         self.free_proxies = []
         self.setup_session()
@@ -50,6 +65,11 @@ class LinkedInScraperFree:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+
+        # Let urllib3 retry transient gateway errors with backoff
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                        allowed_methods=['GET'], raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(max_retries=retries))
     
     def get_free_proxies(self):
         """Get free proxy list (optional - can work without proxies)"""
@@ -62,7 +82,7 @@ class LinkedInScraperFree:
             
             for url in proxy_urls:
                 try:
-                    response = requests.get(url, timeout=10)
+                    response = self.session.get(url, timeout=10)
                     proxies = response.text.strip().split('\n')
                     self.free_proxies.extend([f"http://{proxy}" for proxy in proxies[:5]])
                     break
@@ -76,6 +96,10 @@ class LinkedInScraperFree:
     
     def create_stealth_driver(self):
         """Create a stealth Chrome driver for LinkedIn scraping"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
         options = Options()
         
         # Stealth options
@@ -97,7 +121,7 @@ class LinkedInScraperFree:
         
         try:
             # Use webdriver-manager to automatically handle Chrome driver
-            service = Service(ChromeDriverManager().install())
+            service = Service(get_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=options)
 
             # Execute script to remove webdriver property
@@ -130,6 +154,7 @@ class LinkedInScraperFree:
 
         jobs = []
         start = 0
+        rate_limit_retries = 0
 
         while len(jobs) < max_results and start < 200:
             try:
@@ -151,9 +176,18 @@ class LinkedInScraperFree:
                 response = self.session.get(url, timeout=15)
                 
                 if response.status_code == 429:
-                    logger.warning("Rate limited, waiting...")
-                    time.sleep(random.uniform(30, 60))
+                    if rate_limit_retries >= RATE_LIMIT_MAX_RETRIES:
+                        logger.warning("Still rate limited, giving up on this search")
+                        break
+
+                    delay = min(RATE_LIMIT_MAX_DELAY, RATE_LIMIT_BASE_DELAY * 2 ** rate_limit_retries)
+                    delay *= random.uniform(0.8, 1.2)
+                    rate_limit_retries += 1
+                    logger.warning(f"Rate limited, retrying in {delay:.0f}s...")
+                    time.sleep(delay)
                     continue
+
+                rate_limit_retries = 0
                     
                 if response.status_code != 200:
                     logger.warning(f"API returned {response.status_code}")
@@ -197,6 +231,7 @@ class LinkedInScraperFree:
         Backup method when API fails
         """
         logger.info("🔍 Method 2: Selenium Stealth")
+        from selenium.webdriver.common.by import By
         
         driver = self.create_stealth_driver()
         if not driver:
@@ -290,12 +325,15 @@ class LinkedInScraperFree:
             job_url = link_elem.get('href') if link_elem else "N/A"
             
             # Extract job ID from URL
-            job_id = re.search(r'jobs/view/(\d+)', job_url)
+            job_id = JOB_ID_PATTERN.search(job_url)
             job_id = job_id.group(1) if job_id else "N/A"
             
+            # One timestamp per card so a missing post date matches scraped_at
+            scraped_at = datetime.now().isoformat()
+
             # Extract posting date
             time_elem = card.find('time')
-            posted_date = time_elem.get('datetime') if time_elem else datetime.now().isoformat()
+            posted_date = time_elem.get('datetime') if time_elem else scraped_at
             
             return {
                 'id': job_id,
@@ -305,7 +343,7 @@ class LinkedInScraperFree:
                 'job_url': job_url,
                 'posted_date': posted_date,
                 'site': 'linkedin',
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at
             }
             
         except Exception as e:
@@ -314,6 +352,8 @@ class LinkedInScraperFree:
     
     def parse_selenium_job(self, element):
         """Parse job from Selenium element"""
+        from selenium.webdriver.common.by import By
+
         try:
             title = element.find_element(By.CSS_SELECTOR, 'h3 a').text.strip()
             company = element.find_element(By.CSS_SELECTOR, 'h4 a').text.strip()
@@ -333,7 +373,8 @@ class LinkedInScraperFree:
             logger.warning(f"Error parsing selenium job: {e}")
             return None
     
-    def scrape_jobs(self, keywords, location="Remote", max_results=50, time_filter='r3600', work_type='2'):
+    def scrape_jobs(self, keywords, location="Remote", max_results=50, time_filter='r3600', work_type='2',
+                    return_dict=False):
         """
         Main scraping method with multiple fallbacks and ultra-recent filtering
 
@@ -348,6 +389,7 @@ class LinkedInScraperFree:
                 - '1' = On-site
                 - '2' = Remote (default)
                 - '3' = Hybrid
+            return_dict: Return a list of job dicts instead of a DataFrame
         """
         logger.info(f"🚀 Starting ULTRA-RECENT LinkedIn job scrape for '{keywords}' in '{location}'")
         logger.info(f"⏰ Time filter: {time_filter} | Work type: {work_type}")
@@ -380,7 +422,10 @@ class LinkedInScraperFree:
                 unique_jobs.append(job)
         
         logger.info(f"🎉 Total unique jobs found: {len(unique_jobs)}")
-        
+
+        if return_dict:
+            return unique_jobs
+
         return pd.DataFrame(unique_jobs)
 
 def test_linkedin_scraper():
@@ -4,16 +4,63 @@ Location Manager for JobSprint
 Handles country-specific location filtering with focus on Canada
 """
 
+import re
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+TIME_FILTERS = {
+    "last_5_minutes": "r300",
+    "last_10_minutes": "r600", 
+    "last_15_minutes": "r900",
+    "last_30_minutes": "r1800",
+    "last_1_hour": "r3600",
+    "last_2_hours": "r7200",
+    "last_6_hours": "r21600",
+    "last_24_hours": "r86400"
+}
+
+WORK_TYPE_FILTERS = {
+    "on_site": "1",
+    "remote": "2", 
+    "hybrid": "3"
+}
+
+# Common spellings mapped to the location string LinkedIn searches best with
+CANADA_LOCATION_MAPPINGS = {
+    "toronto": "Toronto, ON",
+    "montreal": "Montreal, QC",
+    "vancouver": "Vancouver, BC",
+    "calgary": "Calgary, AB",
+    "ottawa": "Ottawa, ON",
+    "edmonton": "Edmonton, AB",
+    "halifax": "Halifax, NS",
+    "remote": "Canada Remote",
+    "canada": "Canada Remote"
+}
+
+CANADA_INDICATORS = [
+    "canada", "ontario", "quebec", "british columbia", "bc", "alberta", 
+    "nova scotia", "ns", "new brunswick", "nb", "manitoba", "mb",
+    "saskatchewan", "sk", "prince edward island", "pei", "pe",
+    "newfoundland", "nl", "toronto", "montreal", "vancouver", 
+    "calgary", "ottawa", "edmonton", "halifax", "on", "qc", "ab"
+]
+
+# One scan of the location instead of one substring search per indicator
+CANADA_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, CANADA_INDICATORS)))
+
 class LocationManager:
     """Manages location-specific job search configurations"""
     
     def __init__(self):
         self.locations = self._initialize_locations()
+        # The location data never changes, so build both Canada lists once
+        self._canada_locations = {
+            include_remote: self._build_canada_locations(include_remote)
+            for include_remote in (True, False)
+        }
     
     def _initialize_locations(self) -> Dict:
         """Initialize comprehensive location database"""
@@ -247,6 +294,10 @@ class LocationManager:
     
     def get_canada_locations(self, include_remote: bool = True) -> List[str]:
         """Get all Canada-specific locations"""
+        return list(self._canada_locations[bool(include_remote)])
+
+    def _build_canada_locations(self, include_remote: bool) -> Tuple[str, ...]:
+        """Build the Canada location list from the location data"""
         locations = []
         
         if include_remote:
@@ -258,7 +309,7 @@ class LocationManager:
             if include_remote:
                 locations.extend(province_data["remote"])
         
-        return locations
+        return tuple(locations)
     
     def get_province_locations(self, province: str, include_remote: bool = True) -> List[str]:
         """Get locations for a specific Canadian province"""
@@ -275,24 +326,11 @@ class LocationManager:
     
     def get_ultra_recent_time_filters(self) -> Dict[str, str]:
         """Get time filters for ultra-recent job searches"""
-        return {
-            "last_5_minutes": "r300",
-            "last_10_minutes": "r600", 
-            "last_15_minutes": "r900",
-            "last_30_minutes": "r1800",
-            "last_1_hour": "r3600",
-            "last_2_hours": "r7200",
-            "last_6_hours": "r21600",
-            "last_24_hours": "r86400"
-        }
+        return dict(TIME_FILTERS)
     
     def get_work_type_filters(self) -> Dict[str, str]:
         """Get work type filters"""
-        return {
-            "on_site": "1",
-            "remote": "2", 
-            "hybrid": "3"
-        }
+        return dict(WORK_TYPE_FILTERS)
     
     def get_recommended_canada_search_locations(self) -> List[str]:
         """Get recommended locations for Canada job searches"""
@@ -323,36 +361,13 @@ class LocationManager:
         
         if country_focus == "canada":
             # Handle common variations
-            location_mappings = {
-                "toronto": "Toronto, ON",
-                "montreal": "Montreal, QC",
-                "vancouver": "Vancouver, BC",
-                "calgary": "Calgary, AB",
-                "ottawa": "Ottawa, ON",
-                "edmonton": "Edmonton, AB",
-                "halifax": "Halifax, NS",
-                "remote": "Canada Remote",
-                "canada": "Canada Remote"
-            }
-            
-            location_lower = location.lower()
-            if location_lower in location_mappings:
-                return location_mappings[location_lower]
+            return CANADA_LOCATION_MAPPINGS.get(location.lower(), location)
         
         return location
     
     def is_canada_location(self, location: str) -> bool:
         """Check if a location is Canada-specific"""
-        location_lower = location.lower()
-        canada_indicators = [
-            "canada", "ontario", "quebec", "british columbia", "bc", "alberta", 
-            "nova scotia", "ns", "new brunswick", "nb", "manitoba", "mb",
-            "saskatchewan", "sk", "prince edward island", "pei", "pe",
-            "newfoundland", "nl", "toronto", "montreal", "vancouver", 
-            "calgary", "ottawa", "edmonton", "halifax", "on", "qc", "ab"
-        ]
-        
-        return any(indicator in location_lower for indicator in canada_indicators)
+        return CANADA_INDICATOR_PATTERN.search(location.lower()) is not None
 
 # Global instance
 location_manager = LocationManager()
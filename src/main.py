@@ -19,14 +19,14 @@ NO EXTERNAL JOB SCRAPING DEPENDENCIES - COMPLETELY SELF-SUFFICIENT!
 import os
 import sys
 import time
-import json
+import orjson
 import sqlite3
 import smtplib
 import schedule
 import logging
 import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 import pandas as pd
 
 # Email imports - using direct import approach
@@ -37,6 +37,7 @@ MimeMultipart = email.mime.multipart.MIMEMultipart
 
 # Import our own LinkedIn scraper (no external dependencies!)
 from linkedin_scraper_free import LinkedInScraperFree
+from job_scoring import lowercase_preference_terms
 
 # Configure logging
 logging.basicConfig(
@@ -49,6 +50,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Company name words treated as a basic reputation signal
+COMPANY_SUFFIXES = ('inc', 'corp', 'ltd', 'llc', 'technologies', 'systems')
+
 class JobAutomationSystem:
     """Main class for the LinkedIn Job Automation System"""
     
@@ -98,8 +102,8 @@ class JobAutomationSystem:
         
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
                 # Merge with defaults
                 for key in default_config:
                     if key not in config:
@@ -110,8 +114,8 @@ class JobAutomationSystem:
                 return default_config
         else:
             # Create default config file
-            with open(self.config_file, 'w') as f:
-                json.dump(default_config, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
             logger.info(f"Created default config file: {self.config_file}")
             return default_config
     
@@ -218,9 +222,10 @@ class JobAutomationSystem:
     def scrape_linkedin_jobs(self, keyword: str, location: str) -> pd.DataFrame:
         """Enhanced LinkedIn job scraping with quality checks"""
         try:
-            from linkedin_scraper_free import LinkedInScraperFree
+            from services import get_linkedin_scraper
 
-            linkedin_scraper = LinkedInScraperFree()
+            # Shared scraper keeps its HTTP session (and pooled connections) across searches
+            linkedin_scraper = get_linkedin_scraper()
 
             # Get LinkedIn-specific settings
             linkedin_config = self.config.get("linkedin_settings", {})
@@ -237,7 +242,10 @@ class JobAutomationSystem:
                 # Add LinkedIn-specific metadata
                 jobs_df['site'] = 'linkedin'
                 jobs_df['scraped_method'] = 'enhanced_free'
-                jobs_df['quality_score'] = jobs_df.apply(self.calculate_linkedin_quality_score, axis=1)
+                terms = self.preference_terms()
+                jobs_df['quality_score'] = jobs_df.apply(
+                    lambda row: self.calculate_linkedin_quality_score(row, terms), axis=1
+                )
 
                 # Sort by quality score
                 jobs_df = jobs_df.sort_values('quality_score', ascending=False)
@@ -250,36 +258,40 @@ class JobAutomationSystem:
             logger.error(f"LinkedIn scraping failed: {e}")
             return pd.DataFrame()
 
-    def calculate_linkedin_quality_score(self, job_row) -> float:
+    def preference_terms(self) -> Dict[str, List[str]]:
+        """Lowercased terms from the configured job preferences"""
+        preferences = self.config["job_preferences"]
+        return lowercase_preference_terms(preferences["keywords"], preferences["locations"],
+                                          preferences["exclude_keywords"])
+
+    def calculate_linkedin_quality_score(self, job_row, terms: Optional[Dict[str, List[str]]] = None) -> float:
         """Calculate quality score for LinkedIn jobs (0-100)"""
         score = 50.0  # Base score
 
         try:
+            if terms is None:
+                terms = self.preference_terms()
+
             # Title relevance (check against keywords)
             title = str(job_row.get('title', '')).lower()
-            for keyword in self.config["job_preferences"]["keywords"]:
-                if keyword.lower() in title:
-                    score += 15
-                    break
+            if any(keyword in title for keyword in terms['keywords']):
+                score += 15
 
             # Company reputation (basic check)
             company = str(job_row.get('company', '')).lower()
-            if any(word in company for word in ['inc', 'corp', 'ltd', 'llc', 'technologies', 'systems']):
+            if any(word in company for word in COMPANY_SUFFIXES):
                 score += 10
 
             # Location preference
             location = str(job_row.get('location', '')).lower()
-            for pref_location in self.config["job_preferences"]["locations"]:
-                if pref_location.lower() in location or 'remote' in location:
-                    score += 10
-                    break
+            if terms['locations'] and ('remote' in location or
+                                       any(pref_location in location for pref_location in terms['locations'])):
+                score += 10
 
             # Exclude keywords penalty
-            full_text = f"{title} {company} {str(job_row.get('description', ''))}".lower()
-            for exclude_word in self.config["job_preferences"]["exclude_keywords"]:
-                if exclude_word.lower() in full_text:
-                    score -= 20
-                    break
+            full_text = f"{title} {company} {str(job_row.get('description', '')).lower()}"
+            if any(exclude_word in full_text for exclude_word in terms['exclude_keywords']):
+                score -= 20
 
             # Recent posting bonus
             posted_date = job_row.get('posted_date', '')
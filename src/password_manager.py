@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Password Manager for JobSprint
+Argon2 password hashing with support for legacy SHA-256 hashes
+"""
+
+import hmac
+import hashlib
+import logging
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+
+logger = logging.getLogger(__name__)
+
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage"""
+    return password_hasher.hash(password)
+
+def is_legacy_hash(password_hash: str) -> bool:
+    """Check for an unsalted SHA-256 hex digest from before Argon2"""
+    return len(password_hash) == 64 and not password_hash.startswith('$')
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Verify a password against a stored Argon2 or legacy SHA-256 hash"""
+    if not password_hash:
+        return False
+
+    if is_legacy_hash(password_hash):
+        candidate = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(candidate, password_hash)
+
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def needs_rehash(password_hash: str) -> bool:
+    """Check if a stored hash should be upgraded after a successful login"""
+    return is_legacy_hash(password_hash) or password_hasher.check_needs_rehash(password_hash)
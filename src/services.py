@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Shared service instances for JobSprint
+Each factory builds its manager on first use and once per process, so workers
+boot without touching the network and every entry point shares one instance
+"""
+
+import functools
+
+@functools.cache
+def get_supabase_manager():
+    """Get the shared Supabase manager"""
+    from supabase_manager import SupabaseManager
+    return SupabaseManager()
+
+@functools.cache
+def get_linkedin_scraper():
+    """Get the shared LinkedIn scraper"""
+    from linkedin_scraper_free import LinkedInScraperFree
+    return LinkedInScraperFree()
+
+@functools.cache
+def get_location_manager():
+    """Get the shared location manager (the module's global instance)"""
+    from location_manager import location_manager
+    return location_manager
@@ -5,12 +5,12 @@ Web UI for LinkedIn Job Automation System
 
 import os
 import sys
-import json
 import sqlite3
+import tempfile
+import orjson
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
 import threading
-import time
 
 # Add current directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -30,6 +30,7 @@ app.secret_key = 'linkedin-job-automation-secret-key'
 # Global automation instance
 automation = None
 monitoring_thread = None
+monitoring_stop = threading.Event()
 is_monitoring = False
 
 @app.route('/')
@@ -174,12 +175,23 @@ def save_config():
             }
         }
         
-        # Save to file
-        with open('config.json', 'w') as f:
-            json.dump(config, f, indent=2)
-        
-        # Reload automation system
-        automation = JobAutomationSystem()
+        # Save to file - skip the write and reload when nothing changed
+        config_bytes = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        try:
+            with open('config.json', 'rb') as f:
+                unchanged = f.read() == config_bytes
+        except FileNotFoundError:
+            unchanged = False
+
+        if not unchanged:
+            # Write to a unique temp file and swap it in so readers never see a
+            # partial config and concurrent saves don't share a temp path
+            with tempfile.NamedTemporaryFile(dir='.', prefix='config.', suffix='.tmp', delete=False) as f:
+                f.write(config_bytes)
+            os.replace(f.name, 'config.json')
+
+            # Reload automation system
+            automation = JobAutomationSystem()
         
         flash('Configuration saved successfully!', 'success')
         
@@ -191,14 +203,16 @@ def save_config():
 @app.route('/start_monitoring')
 def start_monitoring():
     """Start job monitoring"""
-    global automation, monitoring_thread, is_monitoring
+    global automation, monitoring_thread, monitoring_stop, is_monitoring
     
     if not automation:
         automation = JobAutomationSystem()
     
     if not is_monitoring:
         is_monitoring = True
-        monitoring_thread = threading.Thread(target=run_monitoring, daemon=True)
+        # Fresh event per thread so a quick stop/start can't revive the old loop
+        monitoring_stop = threading.Event()
+        monitoring_thread = threading.Thread(target=run_monitoring, args=(monitoring_stop,), daemon=True)
         monitoring_thread.start()
         flash('Job monitoring started!', 'success')
     else:
@@ -212,6 +226,7 @@ def stop_monitoring():
     global is_monitoring
     
     is_monitoring = False
+    monitoring_stop.set()  # Wake the monitoring thread so it exits now
     flash('Job monitoring stopped!', 'info')
     
     return redirect(url_for('index'))
@@ -336,19 +351,19 @@ def test_job_search():
         </div>
         """
 
-def run_monitoring():
-    """Background monitoring function"""
-    global automation, is_monitoring
+def run_monitoring(stop_event: threading.Event):
+    """Background monitoring function, runs until stop_event is set"""
+    global automation
     
-    while is_monitoring:
+    while not stop_event.is_set():
         try:
             automation.run_job_check()
-            # Wait for the configured interval
+            # Wait for the configured interval (returns early when stopped)
             interval_minutes = automation.config["scraping"]["check_interval_minutes"]
-            time.sleep(interval_minutes * 60)
+            stop_event.wait(interval_minutes * 60)
         except Exception as e:
             print(f"Error in monitoring: {e}")
-            time.sleep(60)  # Wait 1 minute before retrying
+            stop_event.wait(60)  # Wait 1 minute before retrying
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
@@ -360,4 +375,9 @@ if __name__ == '__main__':
     print("📧 Configure your email settings in the web interface")
     print("🎯 Set your job preferences and start monitoring!")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # Single process keeps the monitoring thread and automation instance shared
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)